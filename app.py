@@ -1,9 +1,14 @@
+import os
 import streamlit as st
+from typing import NamedTuple
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import pycountry
 from plotly.subplots import make_subplots
+from plotly_resampler import FigureResampler
+from kernels import kpi_reduce
 import altair as alt
 from streamlit_extras.metric_cards import style_metric_cards
 import streamlit.components.v1 as components
@@ -42,14 +47,195 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
-# Load the data
+# Columns exposed as sidebar multiselect filters
+FILTER_COLUMNS = ['Country', 'Industry', 'Top AI Tools Used', 'Regulation Status']
+
+# Key metrics shown across the KPI cards and analytics tabs
+METRIC_COLUMNS = [
+    'AI Adoption Rate (%)',
+    'Job Loss Due to AI (%)',
+    'Revenue Increase Due to AI (%)',
+    'Human-AI Collaboration Rate (%)'
+]
+
+# Raw CSV and the typed Parquet copy written from it on first load
+DATA_CSV_PATH = "Global_AI_Content_Impact_Dataset.csv"
+DATA_PARQUET_PATH = "Global_AI_Content_Impact_Dataset.parquet"
+
+# Explicit dtypes for the dataset; every measure is a percentage or a value
+# under 100, so float32 is ample and halves the bytes each scan touches
+DATA_DTYPES = {
+    'Year': 'int16',
+    **{col: 'category' for col in FILTER_COLUMNS},
+    **{col: 'float32' for col in METRIC_COLUMNS},
+    'AI-Generated Content Volume (TBs per year)': 'float32',
+    'Consumer Trust in AI (%)': 'float32',
+    'Market Share of AI Companies (%)': 'float32'
+}
+
+# Dataset country names that pycountry can't resolve on its own
+COUNTRY_ISO_ALIASES = {'UK': 'GBR', 'South Korea': 'KOR'}
+
+# Resolve a country name to its ISO-3 code, or None if it is unknown
+def country_to_iso3(name):
+    if name in COUNTRY_ISO_ALIASES:
+        return COUNTRY_ISO_ALIASES[name]
+    try:
+        return pycountry.countries.lookup(name).alpha_3
+    except LookupError:
+        return None
+
+# Load the data, converting the CSV to Parquet once so later loads skip text parsing.
+# The Parquet copy is rebuilt when the CSV is newer or its dtypes no longer match.
 @st.cache_data
 def load_data():
-    df = pd.read_csv("Global_AI_Content_Impact_Dataset.csv")
+    if (
+        os.path.exists(DATA_PARQUET_PATH)
+        and os.path.getmtime(DATA_PARQUET_PATH) >= os.path.getmtime(DATA_CSV_PATH)
+    ):
+        df = pd.read_parquet(DATA_PARQUET_PATH, engine='pyarrow')
+        if 'Country ISO' in df and all(
+            str(df[col].dtype) == dtype for col, dtype in DATA_DTYPES.items()
+        ):
+            return df
+    df = pd.read_csv(DATA_CSV_PATH, dtype=DATA_DTYPES)
+    # ISO-3 codes let the map skip plotly's country-name lookup
+    iso_codes = {name: country_to_iso3(name) for name in df['Country'].cat.categories}
+    df['Country ISO'] = df['Country'].map(iso_codes).astype('category')
+    # The Parquet copy is only an optimization: write it atomically via a temp file
+    # so concurrent first loads never read a partial file, and skip it if the
+    # directory isn't writable
+    tmp_path = f"{DATA_PARQUET_PATH}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, DATA_PARQUET_PATH)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
     return df
 
+# Map each filter value to its categorical code so filtering runs on integer arrays
+@st.cache_data
+def load_category_codes():
+    df = load_data()
+    return {
+        col: dict(zip(df[col].cat.categories, range(len(df[col].cat.categories))))
+        for col in FILTER_COLUMNS
+    }
+
+# Cached helpers below take only the primitive filter selection (year bounds and
+# sorted tuples), never a DataFrame, so Streamlit's cache hasher never touches
+# frame contents; the data itself comes from the cached load_data() inside them.
+
+# Per-selection caches keep at most this many filter combinations each, so a
+# shared server's memory stays bounded however many selections users try
+FILTER_CACHE_MAX_ENTRIES = 64
+
+# Filter the dataframe with a single boolean mask over the categorical codes
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def filter_data(year_start, year_end, countries, industries, tools, regs):
+    df = load_data()
+    category_codes = load_category_codes()
+    year_values = df['Year'].values
+    mask = (year_values >= year_start) & (year_values <= year_end)
+    for col, selected in zip(FILTER_COLUMNS, [countries, industries, tools, regs]):
+        selected_codes = np.fromiter(
+            (category_codes[col][value] for value in selected),
+            dtype=np.int32,
+            count=len(selected)
+        )
+        mask &= np.isin(df[col].cat.codes.values, selected_codes, kind='table')
+    return df.iloc[np.flatnonzero(mask)]
+
+class Aggregates(NamedTuple):
+    trend_df: pd.DataFrame
+    geo_df: pd.DataFrame
+    country_df: pd.DataFrame
+    industry_df: pd.DataFrame
+    industry_trend_df: pd.DataFrame
+    tool_df: pd.DataFrame
+    corr_df: pd.DataFrame
+    kpis: pd.DataFrame
+
+# Compute every aggregation used by the dashboard for a given filter selection
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def compute_aggregates(year_start, year_end, countries, industries, tools, regs):
+    filtered_df = filter_data(year_start, year_end, countries, industries, tools, regs)
+
+    trend_df = filtered_df.groupby('Year', sort=True, observed=True)[METRIC_COLUMNS].mean().reset_index()
+
+    # One representative row per country; the industries behind it go in the hover
+    geo_df = filtered_df.groupby('Country', observed=True).agg({
+        'AI Adoption Rate (%)': 'mean',
+        'Revenue Increase Due to AI (%)': 'mean',
+        'Country ISO': 'first',
+        'Industry': lambda s: ', '.join(sorted(s.unique()))
+    }).reset_index().rename(columns={'Industry': 'Industries'})
+
+    country_df = filtered_df.groupby('Country', observed=True).agg({
+        'AI Adoption Rate (%)': 'mean',
+        'Job Loss Due to AI (%)': 'mean',
+        'Revenue Increase Due to AI (%)': 'mean'
+    }).reset_index()
+
+    industry_df = filtered_df.groupby('Industry', observed=True).agg({
+        'AI Adoption Rate (%)': 'mean',
+        'Job Loss Due to AI (%)': 'mean',
+        'Revenue Increase Due to AI (%)': 'mean',
+        'Human-AI Collaboration Rate (%)': 'mean'
+    }).reset_index()
+
+    industry_trend_df = filtered_df.groupby(['Year', 'Industry'], observed=True, as_index=False)[
+        'AI Adoption Rate (%)'
+    ].mean()
+    industry_trend_df['Industry'] = industry_trend_df['Industry'].cat.remove_unused_categories()
+
+    tool_df = filtered_df.groupby('Top AI Tools Used', observed=True).agg({
+        'AI Adoption Rate (%)': 'mean',
+        'Revenue Increase Due to AI (%)': 'mean'
+    }).reset_index()
+
+    # Correlate the metrics with numpy on a contiguous float32 array; fewer than two
+    # rows (or a constant column) leaves the coefficients undefined, as with DataFrame.corr
+    metric_values = filtered_df[METRIC_COLUMNS].to_numpy(dtype=np.float32)
+    if len(metric_values) > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr_values = np.corrcoef(metric_values, rowvar=False)
+    else:
+        corr_values = np.full((len(METRIC_COLUMNS), len(METRIC_COLUMNS)), np.nan)
+    corr_df = pd.DataFrame(corr_values, index=METRIC_COLUMNS, columns=METRIC_COLUMNS)
+
+    kpis = pd.DataFrame(
+        kpi_reduce(np.asfortranarray(filtered_df[METRIC_COLUMNS].to_numpy(dtype=np.float32))),
+        index=['mean', 'min', 'max'],
+        columns=METRIC_COLUMNS
+    )
+
+    return Aggregates(
+        trend_df, geo_df, country_df, industry_df, industry_trend_df, tool_df, corr_df, kpis
+    )
+
+# Sorted option lists for the sidebar filters; categories are already sorted
+@st.cache_data
+def load_filter_options():
+    df = load_data()
+    return {col: df[col].cat.categories.tolist() for col in FILTER_COLUMNS}
+
 df = load_data()
 
+# Initialise the sidebar options and default selections once per session
+if 'filter_options' not in st.session_state:
+    filter_options = load_filter_options()
+    st.session_state.filter_options = filter_options
+    st.session_state.filter_defaults = {
+        'Country': filter_options['Country'][:5],
+        'Industry': filter_options['Industry'][:3],
+        'Top AI Tools Used': filter_options['Top AI Tools Used'],
+        'Regulation Status': filter_options['Regulation Status']
+    }
+filter_options = st.session_state.filter_options
+filter_defaults = st.session_state.filter_defaults
+
 # Sidebar with enhanced styling
 with st.sidebar:
     st.markdown("### 🎯 Filters")
@@ -66,87 +252,90 @@ with st.sidebar:
     
     # Country filter with search
     st.markdown("#### 🌍 Countries")
-    countries = sorted(df['Country'].unique())
+    countries = filter_options['Country']
     selected_countries = st.multiselect(
         "Select Countries",
         countries,
-        default=countries[:5],
+        default=filter_defaults['Country'],
         key="countries"
     )
     
     # Industry filter with search
     st.markdown("#### 🏢 Industries")
-    industries = sorted(df['Industry'].unique())
+    industries = filter_options['Industry']
     selected_industries = st.multiselect(
         "Select Industries",
         industries,
-        default=industries[:3],
+        default=filter_defaults['Industry'],
         key="industries"
     )
     
     # AI Tools filter
     st.markdown("#### 🛠️ AI Tools")
-    tools = sorted(df['Top AI Tools Used'].unique())
+    tools = filter_options['Top AI Tools Used']
     selected_tools = st.multiselect(
         "Select AI Tools",
         tools,
-        default=tools,
+        default=filter_defaults['Top AI Tools Used'],
         key="tools"
     )
     
     # Regulation Status filter
     st.markdown("#### 📜 Regulation Status")
-    reg_status = sorted(df['Regulation Status'].unique())
+    reg_status = filter_options['Regulation Status']
     selected_reg = st.multiselect(
         "Select Regulation Status",
         reg_status,
-        default=reg_status,
+        default=filter_defaults['Regulation Status'],
         key="reg"
     )
 
-# Filter the dataframe
-filtered_df = df[
-    (df['Year'].between(year_range[0], year_range[1])) &
-    (df['Country'].isin(selected_countries)) &
-    (df['Industry'].isin(selected_industries)) &
-    (df['Top AI Tools Used'].isin(selected_tools)) &
-    (df['Regulation Status'].isin(selected_reg))
-]
+# Hashable filter selection used as the cache key for all aggregations
+filter_key = (
+    year_range[0],
+    year_range[1],
+    tuple(sorted(selected_countries)),
+    tuple(sorted(selected_industries)),
+    tuple(sorted(selected_tools)),
+    tuple(sorted(selected_reg))
+)
+filtered_df = filter_data(*filter_key)
+agg = compute_aggregates(*filter_key)
 
 # Key Metrics with enhanced styling
 st.markdown("### 📈 Key Performance Indicators")
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    avg_adoption = filtered_df['AI Adoption Rate (%)'].mean()
+    adoption = agg.kpis['AI Adoption Rate (%)']
     st.metric(
         "AI Adoption Rate",
-        f"{avg_adoption:.2f}%",
-        f"{filtered_df['AI Adoption Rate (%)'].max() - avg_adoption:.2f}% from max"
+        f"{adoption['mean']:.2f}%",
+        f"{adoption['max'] - adoption['mean']:.2f}% from max"
     )
 
 with col2:
-    avg_job_loss = filtered_df['Job Loss Due to AI (%)'].mean()
+    job_loss = agg.kpis['Job Loss Due to AI (%)']
     st.metric(
         "Job Loss Due to AI",
-        f"{avg_job_loss:.2f}%",
-        f"{avg_job_loss - filtered_df['Job Loss Due to AI (%)'].min():.2f}% from min"
+        f"{job_loss['mean']:.2f}%",
+        f"{job_loss['mean'] - job_loss['min']:.2f}% from min"
     )
 
 with col3:
-    avg_revenue = filtered_df['Revenue Increase Due to AI (%)'].mean()
+    revenue = agg.kpis['Revenue Increase Due to AI (%)']
     st.metric(
         "Revenue Increase",
-        f"{avg_revenue:.2f}%",
-        f"{filtered_df['Revenue Increase Due to AI (%)'].max() - avg_revenue:.2f}% from max"
+        f"{revenue['mean']:.2f}%",
+        f"{revenue['max'] - revenue['mean']:.2f}% from max"
     )
 
 with col4:
-    avg_collaboration = filtered_df['Human-AI Collaboration Rate (%)'].mean()
+    collaboration = agg.kpis['Human-AI Collaboration Rate (%)']
     st.metric(
         "Human-AI Collaboration",
-        f"{avg_collaboration:.2f}%",
-        f"{avg_collaboration - filtered_df['Human-AI Collaboration Rate (%)'].min():.2f}% from min"
+        f"{collaboration['mean']:.2f}%",
+        f"{collaboration['mean'] - collaboration['min']:.2f}% from min"
     )
 
 style_metric_cards()
@@ -154,104 +343,93 @@ style_metric_cards()
 # Advanced Analytics Section
 st.markdown("### 📊 Advanced Analytics")
 
-# Create tabs for different analysis sections
-tab1, tab2, tab3, tab4 = st.tabs(["📈 Trends", "🌍 Geographic", "🏢 Industry", "🔍 Deep Dive"])
+# Figure builders, cached per filter selection as plotly JSON dicts so reruns
+# skip both figure construction and the aggregations behind them
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_trend_figure(filter_key):
+    agg = compute_aggregates(*filter_key)
 
-with tab1:
-    # Time Series Analysis with multiple metrics
-    st.subheader("📈 Time Series Analysis")
-    
-    # Create subplot for multiple metrics
-    fig_trend = make_subplots(
+    # Create subplot for multiple metrics; the resampler downsamples long series
+    # server-side so the browser only receives a viewport-sized set of points
+    fig_trend = FigureResampler(make_subplots(
         rows=2, cols=2,
         subplot_titles=(
             "AI Adoption Rate", "Job Loss",
             "Revenue Increase", "Human-AI Collaboration"
         )
-    )
-    
-    metrics = [
-        'AI Adoption Rate (%)',
-        'Job Loss Due to AI (%)',
-        'Revenue Increase Due to AI (%)',
-        'Human-AI Collaboration Rate (%)'
-    ]
-    
-    for i, metric in enumerate(metrics):
+    ))
+
+    for i, metric in enumerate(METRIC_COLUMNS):
         row = i // 2 + 1
         col = i % 2 + 1
-        
-        yearly_data = filtered_df.groupby('Year')[metric].mean().reset_index()
+
         fig_trend.add_trace(
-            go.Scatter(
-                x=yearly_data['Year'],
-                y=yearly_data[metric],
+            go.Scattergl(
                 name=metric,
                 mode='lines+markers'
             ),
+            hf_x=agg.trend_df['Year'].values,
+            hf_y=agg.trend_df[metric].values,
             row=row, col=col
         )
-    
+
     fig_trend.update_layout(height=600, showlegend=False)
-    st.plotly_chart(fig_trend, use_container_width=True)
+    return fig_trend.to_plotly_json()
 
-with tab2:
-    # Geographic Analysis
-    st.subheader("🌍 Geographic Analysis")
-    
-    # Create a choropleth map (simulated with scatter plot)
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_map_figure(filter_key):
+    agg = compute_aggregates(*filter_key)
+
+    # Create a choropleth map (simulated with scatter plot), one marker per country
     fig_map = px.scatter_geo(
-        filtered_df,
-        locations='Country',
-        locationmode='country names',
+        agg.geo_df,
+        locations='Country ISO',
+        locationmode='ISO-3',
         color='AI Adoption Rate (%)',
         size='Revenue Increase Due to AI (%)',
         hover_name='Country',
-        hover_data=['Industry', 'Year', 'AI Adoption Rate (%)'],
+        hover_data=['AI Adoption Rate (%)', 'Revenue Increase Due to AI (%)', 'Industries'],
         title='Global AI Impact Distribution'
     )
-    st.plotly_chart(fig_map, use_container_width=True)
-    
-    # Country comparison
-    st.subheader("Country Comparison")
-    country_metrics = filtered_df.groupby('Country').agg({
-        'AI Adoption Rate (%)': 'mean',
-        'Job Loss Due to AI (%)': 'mean',
-        'Revenue Increase Due to AI (%)': 'mean'
-    }).reset_index()
-    
-    fig_country = px.bar(
-        country_metrics,
-        x='Country',
-        y=['AI Adoption Rate (%)', 'Job Loss Due to AI (%)', 'Revenue Increase Due to AI (%)'],
+    return fig_map.to_plotly_json()
+
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_country_figure(filter_key):
+    country_metrics = compute_aggregates(*filter_key).country_df
+
+    # Grouped bars built trace-by-trace on the aggregated frame, skipping px's melt
+    fig_country = go.Figure()
+    for metric in ['AI Adoption Rate (%)', 'Job Loss Due to AI (%)', 'Revenue Increase Due to AI (%)']:
+        fig_country.add_trace(go.Bar(
+            x=country_metrics['Country'],
+            y=country_metrics[metric],
+            name=metric
+        ))
+    fig_country.update_layout(
+        barmode='group',
         title='Country-wise Metrics Comparison',
-        barmode='group'
+        xaxis_title='Country',
+        yaxis_title='value',
+        legend_title_text='variable'
     )
-    st.plotly_chart(fig_country, use_container_width=True)
+    return fig_country.to_plotly_json()
+
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_industry_radar_figure(filter_key):
+    industry_metrics = compute_aggregates(*filter_key).industry_df
 
-with tab3:
-    # Industry Analysis
-    st.subheader("🏢 Industry Analysis")
-    
-    # Industry comparison
-    industry_metrics = filtered_df.groupby('Industry').agg({
-        'AI Adoption Rate (%)': 'mean',
-        'Job Loss Due to AI (%)': 'mean',
-        'Revenue Increase Due to AI (%)': 'mean',
-        'Human-AI Collaboration Rate (%)': 'mean'
-    }).reset_index()
-    
     # Radar chart using plotly.graph_objects
-    categories = ['AI Adoption Rate (%)', 'Job Loss Due to AI (%)', 'Revenue Increase Due to AI (%)', 'Human-AI Collaboration Rate (%)']
+    categories = METRIC_COLUMNS
     fig_industry = go.Figure()
-    for i, row in industry_metrics.iterrows():
-        values = [row[cat] for cat in categories]
-        values += values[:1]  # close the loop
+    values = industry_metrics[categories].to_numpy()
+    names = industry_metrics['Industry'].to_numpy()
+    theta = categories + [categories[0]]
+    for i in range(len(values)):
         fig_industry.add_trace(go.Scatterpolar(
-            r=values,
-            theta=categories + [categories[0]],
+            r=np.concatenate((values[i], values[i, :1])),  # close the loop
+            theta=theta,
             fill='toself',
-            name=row['Industry']
+            name=names[i]
         ))
     fig_industry.update_layout(
         polar=dict(
@@ -260,54 +438,105 @@ with tab3:
         showlegend=True,
         title='Industry Performance Radar Chart'
     )
-    st.plotly_chart(fig_industry, use_container_width=True)
-    
-    # Industry trends over time
-    st.subheader("Industry Trends Over Time")
+    return fig_industry.to_plotly_json()
+
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_industry_trend_figure(filter_key):
+    agg = compute_aggregates(*filter_key)
+
     fig_industry_trend = px.line(
-        filtered_df,
+        agg.industry_trend_df,
         x='Year',
         y='AI Adoption Rate (%)',
         color='Industry',
         title='Industry-wise AI Adoption Trends'
     )
-    st.plotly_chart(fig_industry_trend, use_container_width=True)
+    return fig_industry_trend.to_plotly_json()
 
-with tab4:
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_correlation_figure(filter_key):
+    agg = compute_aggregates(*filter_key)
+
+    fig_corr = px.imshow(
+        agg.corr_df,
+        title='Correlation Matrix of Key Metrics',
+        color_continuous_scale='RdBu'
+    )
+    return fig_corr.to_plotly_json()
+
+@st.cache_data(max_entries=FILTER_CACHE_MAX_ENTRIES)
+def build_tools_figure(filter_key):
+    tool_analysis = compute_aggregates(*filter_key).tool_df
+
+    fig_tools = go.Figure(go.Scattergl(
+        x=tool_analysis['AI Adoption Rate (%)'],
+        y=tool_analysis['Revenue Increase Due to AI (%)'],
+        text=tool_analysis['Top AI Tools Used'],
+        mode='markers+text',
+        textposition='top center'
+    ))
+    fig_tools.update_layout(
+        title='AI Tools Performance Analysis',
+        xaxis_title='AI Adoption Rate (%)',
+        yaxis_title='Revenue Increase Due to AI (%)'
+    )
+    return fig_tools.to_plotly_json()
+
+# Each tab renders inside its own fragment so interactions within a tab
+# rerun only that tab instead of the whole script
+@st.fragment
+def render_trends(filter_key):
+    # Time Series Analysis with multiple metrics
+    st.subheader("📈 Time Series Analysis")
+    st.plotly_chart(go.Figure(build_trend_figure(filter_key)), use_container_width=True)
+
+@st.fragment
+def render_geographic(filter_key):
+    # Geographic Analysis
+    st.subheader("🌍 Geographic Analysis")
+    st.plotly_chart(go.Figure(build_map_figure(filter_key)), use_container_width=True)
+    
+    # Country comparison
+    st.subheader("Country Comparison")
+    st.plotly_chart(go.Figure(build_country_figure(filter_key)), use_container_width=True)
+
+@st.fragment
+def render_industry(filter_key):
+    # Industry Analysis
+    st.subheader("🏢 Industry Analysis")
+    st.plotly_chart(go.Figure(build_industry_radar_figure(filter_key)), use_container_width=True)
+    
+    # Industry trends over time
+    st.subheader("Industry Trends Over Time")
+    st.plotly_chart(go.Figure(build_industry_trend_figure(filter_key)), use_container_width=True)
+
+@st.fragment
+def render_deep_dive(filter_key):
     # Deep Dive Analysis
     st.subheader("🔍 Deep Dive Analysis")
     
     # Correlation Analysis
     st.markdown("#### Correlation Analysis")
-    corr_matrix = filtered_df[[
-        'AI Adoption Rate (%)',
-        'Job Loss Due to AI (%)',
-        'Revenue Increase Due to AI (%)',
-        'Human-AI Collaboration Rate (%)'
-    ]].corr()
-    
-    fig_corr = px.imshow(
-        corr_matrix,
-        title='Correlation Matrix of Key Metrics',
-        color_continuous_scale='RdBu'
-    )
-    st.plotly_chart(fig_corr, use_container_width=True)
+    st.plotly_chart(go.Figure(build_correlation_figure(filter_key)), use_container_width=True)
     
     # AI Tools Analysis
     st.markdown("#### AI Tools Analysis")
-    tool_analysis = filtered_df.groupby('Top AI Tools Used').agg({
-        'AI Adoption Rate (%)': 'mean',
-        'Revenue Increase Due to AI (%)': 'mean'
-    }).reset_index()
-    
-    fig_tools = px.scatter(
-        tool_analysis,
-        x='AI Adoption Rate (%)',
-        y='Revenue Increase Due to AI (%)',
-        text='Top AI Tools Used',
-        title='AI Tools Performance Analysis'
-    )
-    st.plotly_chart(fig_tools, use_container_width=True)
+    st.plotly_chart(go.Figure(build_tools_figure(filter_key)), use_container_width=True)
+
+# Create tabs for different analysis sections
+tab1, tab2, tab3, tab4 = st.tabs(["📈 Trends", "🌍 Geographic", "🏢 Industry", "🔍 Deep Dive"])
+
+with tab1:
+    render_trends(filter_key)
+
+with tab2:
+    render_geographic(filter_key)
+
+with tab3:
+    render_industry(filter_key)
+
+with tab4:
+    render_deep_dive(filter_key)
 
 # Interactive Data Explorer
 st.markdown("### 📋 Interactive Data Explorer")
@@ -322,13 +551,22 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
-# Enhanced data table with styling
+# Enhanced data table with client-side progress bars for the key metrics
 st.dataframe(
-    filtered_df.style.background_gradient(
-        subset=['AI Adoption Rate (%)', 'Job Loss Due to AI (%)', 'Revenue Increase Due to AI (%)'],
-        cmap='RdYlGn'
-    ),
-    use_container_width=True
+    filtered_df,
+    use_container_width=True,
+    column_config={
+        'Country ISO': None,
+        'AI Adoption Rate (%)': st.column_config.ProgressColumn(
+            min_value=0, max_value=100, format='%.2f%%'
+        ),
+        'Job Loss Due to AI (%)': st.column_config.ProgressColumn(
+            min_value=0, max_value=100, format='%.2f%%'
+        ),
+        'Revenue Increase Due to AI (%)': st.column_config.ProgressColumn(
+            min_value=0, max_value=100, format='%.2f%%'
+        )
+    }
 )
 
 # Footer with additional information
@@ -0,0 +1,34 @@
+# Numba kernels used by the dashboard. They live outside app.py because Streamlit
+# re-executes the script on every rerun, which would recreate (and recompile) the
+# jitted functions each time; an imported module is compiled once per process.
+# No on-disk cache (cache=True): it fails at import when the directory isn't writable.
+import numpy as np
+from numba import njit
+
+# Mean, min and max of each column in a single pass over a float32 array,
+# skipping NaN like DataFrame.agg; a column with no values yields NaN.
+# Serial on purpose: there are only a few columns, and numba's parallel workqueue
+# layer aborts the process when Streamlit sessions call it concurrently.
+# fastmath omits the nnan/ninf flags so the NaN checks and inf seeds stay valid.
+@njit(fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+def kpi_reduce(values):
+    n_rows, n_cols = values.shape
+    out = np.full((3, n_cols), np.nan, dtype=np.float32)
+    for j in range(n_cols):
+        total = 0.0
+        count = 0
+        low = np.inf
+        high = -np.inf
+        for i in range(n_rows):
+            value = values[i, j]
+            if np.isnan(value):
+                continue
+            total += value
+            count += 1
+            low = min(low, value)
+            high = max(high, value)
+        if count > 0:
+            out[0, j] = total / count
+            out[1, j] = low
+            out[2, j] = high
+    return out